@@ -23,11 +23,7 @@ import sys
 import pkg_resources
 
 # Verify Python Version that is running
-try:
-    if not(sys.version_info.major == 2 and sys.version_info.minor == 7) and \
-            not(sys.version_info.major == 3):
-        raise RuntimeError('NAPALM requires Python 2.7 or Python3')
-except AttributeError:
+if not (sys.version_info[:2] == (2, 7) or sys.version_info[0] == 3):
     raise RuntimeError('NAPALM requires Python 2.7 or Python3')
 
 # Try to import napalm
@@ -53,7 +49,6 @@ if HAS_NAPALM and NAPALM_MAJOR >= 2:
     from napalm.base import NetworkDriver
 else:
     # Import std lib
-    import inspect
     import importlib
 
     # Import local modules
@@ -62,6 +57,10 @@ else:
     from napalm_base.utils import py23_compat
     from napalm_base.base import NetworkDriver
 
+    # Driver classes resolved so far, indexed by the library name.
+    # Drivers do not change at runtime, so the lookup is done only once per library.
+    _DRIVER_CACHE = {}
+
     def get_network_driver(module_name, prepend=True):
         """
         Searches for a class derived form the base NAPALM class NetworkDriver in a specific library.
@@ -109,8 +108,10 @@ else:
             # Try to not raise error when users requests IOS-XR for e.g.
             module_install_name = module_name.replace('-', '')
             # Can also request using napalm_[SOMETHING]
-            if 'napalm_' not in module_install_name and prepend is True:
-                module_install_name = 'napalm_{name}'.format(name=module_install_name)
+            if prepend is True and not module_install_name.startswith('napalm_'):
+                module_install_name = 'napalm_' + module_install_name
+            if module_install_name in _DRIVER_CACHE:
+                return _DRIVER_CACHE[module_install_name]
             module = importlib.import_module(module_install_name)
         except ImportError:
             raise ModuleImportError(
@@ -119,8 +120,10 @@ else:
                     )
                 )
 
-        for name, obj in inspect.getmembers(module):
-            if inspect.isclass(obj) and issubclass(obj, NetworkDriver):
+        for obj in vars(module).values():
+            if isinstance(obj, type) and issubclass(obj, NetworkDriver) and \
+                    obj is not NetworkDriver:
+                _DRIVER_CACHE[module_install_name] = obj
                 return obj
 
         # looks like you don't have any Driver class in your module...
@@ -7,32 +7,37 @@ from napalm_base import get_network_driver
 from napalm_base.clitools import helpers
 
 # stdlib
-import pip
 import json
 import logging
 import argparse
 import getpass
 from functools import wraps
 
+# third party libs
+import pkg_resources
+
+
+CENSOR_PARAMETERS = frozenset(["password"])
+
 
 def debugging(name):
     def real_decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-                censor_parameters = ["password"]
-                censored_kwargs = {k: v if k not in censor_parameters else "*******"
-                                   for k, v in kwargs.items()}
-                logger.debug("{} - Calling with args: {}, {}".format(name, args, censored_kwargs))
+                if logger.isEnabledFor(logging.DEBUG):
+                    censored_kwargs = {k: v if k not in CENSOR_PARAMETERS else "*******"
+                                       for k, v in kwargs.items()}
+                    logger.debug("%s - Calling with args: %s, %s", name, args, censored_kwargs)
                 try:
                     r = func(*args, **kwargs)
-                    logger.debug("{} - Successful".format(name))
+                    logger.debug("%s - Successful", name)
                     return r
                 except NotImplementedError:
                     if name not in ["pre_connection_tests", "connection_tests",
                                     "post_connection_tests"]:
-                        logger.debug("{} - Not implemented".format(name))
+                        logger.debug("%s - Not implemented", name)
                 except Exception as e:
-                    logger.error("{} - Failed: {}".format(name, e))
+                    logger.error("%s - Failed: %s", name, e)
                     print("\n================= Traceback =================\n")
                     raise
         return wrapper
@@ -143,9 +148,8 @@ def build_help():
 
 def check_installed_packages():
     logger.debug("Gathering napalm packages")
-    installed_packages = pip.get_installed_distributions()
     napalm_packages = sorted(["{}=={}".format(i.key, i.version)
-                              for i in installed_packages if i.key.startswith("napalm")])
+                              for i in pkg_resources.working_set if i.key.startswith("napalm")])
     for n in napalm_packages:
         logger.debug(n)
 
@@ -177,9 +181,9 @@ def call_post_connection(device):
 
 @debugging("get_facts")
 def call_facts(device):
-    facts = device.get_facts()
-    logger.debug("Gathered facts:\n{}".format(json.dumps(facts, indent=4)))
-    print(json.dumps(facts, indent=4))
+    facts = json.dumps(device.get_facts(), indent=4)
+    logger.debug("Gathered facts:\n%s", facts)
+    print(facts)
 
 
 @debugging("close")
@@ -232,11 +236,11 @@ def configuration_change(device, config_file, strategy, dry_run):
 
 @debugging("method")
 def call_getter(device, method, **kwargs):
-    logger.debug("{} - Attempting to resolve method".format(method))
+    logger.debug("%s - Attempting to resolve method", method)
     func = getattr(device, method)
-    logger.debug("{} - Attempting to call method with kwargs: {}".format(method, kwargs))
+    logger.debug("%s - Attempting to call method with kwargs: %s", method, kwargs)
     r = func(**kwargs)
-    logger.debug("{} - Response".format(method))
+    logger.debug("%s - Response", method)
     print(json.dumps(r, indent=4))
 
 
@@ -109,7 +109,8 @@ def textfsm_extractor(cls, template_name, raw_text):
     )
 
     try:
-        fsm_handler = textfsm.TextFSM(open(template_path))
+        with open(template_path) as template_file:
+            fsm_handler = textfsm.TextFSM(template_file)
     except IOError:
         raise napalm_base.exceptions.TemplateNotImplemented(
             "TextFSM template {template_name}.tpl is not defined under {path}".format(
@@ -25,9 +25,23 @@ import os
 import re
 
 
+from functools import wraps
 from pydoc import locate
 
 
+# getargspec is deprecated in python3 and was removed in python 3.11
+_getargspec = getattr(inspect, 'getfullargspec', None) or inspect.getargspec
+
+# Signatures of the NetworkDriver methods don't change, inspect each of them only once
+_ARGSPEC_CACHE = {}
+
+# Replaces the characters of a command that can't be used in a filename
+_CLI_SANITIZE_RE = re.compile('[^a-zA-Z0-9]+')
+
+# Methods other than the getters served from the mocked data
+_MOCKED_METHODS = frozenset()
+
+
 def raise_exception(result):
     exc = locate(result["exception"])
     if exc:
@@ -37,29 +51,35 @@ def raise_exception(result):
 
 
 def is_mocked_method(method):
-    mocked_methods = []
-    if method.startswith("get_") or method in mocked_methods:
-        return True
-    return False
+    return method.startswith("get_") or method in _MOCKED_METHODS
+
+
+def _argspec(name):
+    """Return the argument names of NetworkDriver.<name> and whether it takes self."""
+    try:
+        return _ARGSPEC_CACHE[name]
+    except KeyError:
+        args = _getargspec(getattr(NetworkDriver, name)).args
+        argspec = _ARGSPEC_CACHE[name] = (frozenset(args), 0 if 'self' not in args else 1)
+        return argspec
 
 
 def mocked_method(path, name, count):
-    parent_method = getattr(NetworkDriver, name)
-    parent_method_args = inspect.getargspec(parent_method)
-    modifier = 0 if 'self' not in parent_method_args.args else 1
+    arg_names, modifier = _argspec(name)
+    arg_count = len(arg_names)
 
     def _mocked_method(*args, **kwargs):
         # Check len(args)
-        if len(args) + len(kwargs) + modifier > len(parent_method_args.args):
+        if len(args) + len(kwargs) + modifier > arg_count:
             raise TypeError(
                 "{}: expected at most {} arguments, got {}".format(
-                    name, len(parent_method_args.args), len(args) + modifier))
+                    name, arg_count, len(args) + modifier))
 
         # Check kwargs
-        unexpected = [x for x in kwargs if x not in parent_method_args.args]
-        if unexpected:
+        unexpected = next((x for x in kwargs if x not in arg_names), None)
+        if unexpected is not None:
             raise TypeError("{} got an unexpected keyword argument '{}'".format(name,
-                                                                                unexpected[0]))
+                                                                                unexpected))
         return mocked_data(path, name, count)
 
     return _mocked_method
@@ -140,11 +160,10 @@ class MockDriver(NetworkDriver):
     def cli(self, commands):
         count = self._count_calls("cli")
         result = {}
-        regexp = re.compile('[^a-zA-Z0-9]+')
+        base = os.path.join(self.path, "cli.{}".format(count))
         for i, c in enumerate(commands):
-            sanitized = re.sub(regexp, '_', c)
-            name = "cli.{}.{}".format(count, sanitized)
-            filename = "{}.{}".format(os.path.join(self.path, name), i)
+            sanitized = _CLI_SANITIZE_RE.sub('_', c)
+            filename = "{}.{}.{}".format(base, sanitized, i)
             with open(filename, 'r') as f:
                 result[c] = f.read()
         return result
@@ -190,10 +209,18 @@ class MockDriver(NetworkDriver):
         """This one is only useful for junos."""
         return list(self.cli([get]).values())[0]
 
-    def __getattribute__(self, name):
-        if is_mocked_method(name):
-            self._raise_if_closed()
-            count = self._count_calls(name)
-            return mocked_method(self.path, name, count)
-        else:
-            return object.__getattribute__(self, name)
+
+def _mocked_getter(name):
+    @wraps(getattr(NetworkDriver, name))
+    def getter(self, *args, **kwargs):
+        self._raise_if_closed()
+        count = self._count_calls(name)
+        return mocked_method(self.path, name, count)(*args, **kwargs)
+    return getter
+
+
+# Install the getters on the class, so accessing any other attribute doesn't go through python code
+for _name in dir(NetworkDriver):
+    if is_mocked_method(_name):
+        setattr(MockDriver, _name, _mocked_getter(_name))
+del _name
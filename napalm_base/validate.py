@@ -5,8 +5,6 @@ See: https://napalm.readthedocs.io/en/latest/validate.html
 """
 from __future__ import unicode_literals
 
-import yaml
-
 from napalm_base.exceptions import ValidationException
 from napalm_base.utils import py23_compat
 
@@ -19,14 +17,25 @@ numeric_compare_regex = re.compile("^(<|>|<=|>=|==|!=)(\d+(\.\d+){0,1})$")
 
 
 def _get_validation_file(validation_file):
+    # Only needed when reading a validation file; keep it out of the import path of base.py
+    import yaml
+    try:
+        # libyaml bindings are much faster than the pure python loader
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
     try:
-        with open(validation_file, 'r') as stream:
-            try:
-                validation_source = yaml.load(stream)
-            except yaml.YAMLError as exc:
-                raise ValidationException(exc)
+        # read it at once instead of letting the loader pull small chunks from the stream
+        with open(validation_file, 'rb') as stream:
+            validation_data = stream.read()
     except IOError:
         raise ValidationException("File {0} not found.".format(validation_file))
+
+    try:
+        validation_source = yaml.load(validation_data, Loader=SafeLoader)
+    except yaml.YAMLError as exc:
+        raise ValidationException(exc)
     return validation_source
 
 
@@ -45,19 +54,13 @@ def _compare_getter_list(src, dst, mode):
     for src_element in src:
         found = False
 
-        i = 0
-        while True:
-            try:
-                intermediate_match = _compare_getter(src_element, dst[i])
-                if isinstance(intermediate_match, dict) and intermediate_match["complies"] or \
-                   not isinstance(intermediate_match, dict) and intermediate_match:
-                    found = True
-                    result["present"].append(src_element)
-                    dst.pop(i)
-                    break
-                else:
-                    i += 1
-            except IndexError:
+        for i, dst_element in enumerate(dst):
+            intermediate_match = _compare_getter(src_element, dst_element)
+            if isinstance(intermediate_match, dict) and intermediate_match["complies"] or \
+               not isinstance(intermediate_match, dict) and intermediate_match:
+                found = True
+                result["present"].append(src_element)
+                dst.pop(i)
                 break
 
         if not found:
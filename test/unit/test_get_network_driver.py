@@ -5,9 +5,12 @@ from __future__ import unicode_literals
 import unittest
 from ddt import ddt, data
 
+import napalm_base
 from napalm_base import get_network_driver
 from napalm_base.base import NetworkDriver
 from napalm_base.exceptions import ModuleImportError
+from napalm_base.mock import MockDriver
+from napalm_base.utils import py23_compat
 
 
 @ddt
@@ -25,3 +28,29 @@ class TestGetNetworkDriver(unittest.TestCase):
     def test_get_wrong_network_driver(self, driver):
         """Check that inexisting driver throws ModuleImportError."""
         self.assertRaises(ModuleImportError, get_network_driver, driver, prepend=False)
+
+    def test_get_network_driver_skips_base_class(self):
+        """Check that the NetworkDriver base class is not returned as a driver."""
+        self.assertRaises(ModuleImportError, get_network_driver, 'napalm_base.base')
+        self.assertIs(get_network_driver('napalm_base.mock'), MockDriver)
+
+    def test_get_network_driver_prepends_prefix(self):
+        """Check that the prefix is added when napalm_ is not at the start of the name."""
+        with self.assertRaises(ModuleImportError) as cm:
+            get_network_driver('foo_napalm_x')
+        self.assertIn('"napalm_foo_napalm_x"', py23_compat.text_type(cm.exception))
+
+    def test_get_network_driver_cached(self):
+        """Check that a driver already resolved is not imported again."""
+        self.assertIs(get_network_driver('napalm_base.mock'), MockDriver)
+        self.assertIs(napalm_base._DRIVER_CACHE['napalm_base.mock'], MockDriver)
+
+        def import_module(name):
+            raise AssertionError('{} imported again'.format(name))
+
+        original_import_module = napalm_base.importlib.import_module
+        napalm_base.importlib.import_module = import_module
+        try:
+            self.assertIs(get_network_driver('napalm_base.mock'), MockDriver)
+        finally:
+            napalm_base.importlib.import_module = original_import_module
@@ -9,6 +9,7 @@ from __future__ import unicode_literals
 
 # NAPALM base
 from napalm_base import get_network_driver
+from napalm_base.base import NetworkDriver
 import napalm_base.exceptions
 from napalm_base.utils import py23_compat
 
@@ -66,6 +67,19 @@ class TestMockDriver(object):
         assert d.get_facts()["hostname"] == "changed_hostname"
         d.close()
 
+    def test_getter_counted_on_call(self):
+        d = driver("blah", "bleh", "blih", optional_args=optional_args)
+        d.open()
+        getter = d.get_facts
+        assert d.get_facts()["hostname"] == "localhost"
+        assert getter()["hostname"] == "changed_hostname"
+        d.close()
+
+    def test_getter_keeps_parent_introspection(self):
+        parent = getattr(NetworkDriver, "get_route_to")
+        assert driver.get_route_to.__name__ == "get_route_to"
+        assert driver.get_route_to.__doc__ == parent.__doc__
+
     def test_not_mocking_getters(self):
         d = driver("blah", "bleh", "blih", optional_args=optional_args)
         d.open()
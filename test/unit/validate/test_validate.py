@@ -149,16 +149,19 @@ class FakeDriver(NetworkDriver):
 
     def __init__(self, path):
         self.path = path
+        self.cache = {}
+
+    def load_json(self, name):
+        """Return the mocked data of a method, reading its file only once."""
+        if name not in self.cache:
+            with open(os.path.join(self.path, "{}.json".format(name)), 'r') as f:
+                self.cache[name] = f.read()
+        # Decode it on every call, the compliance report modifies the returned object
+        return json.loads(self.cache[name])
 
     def __getattribute__(self, name):
-        def load_json(filename):
-            def func(**kwargs):
-                with open(filename, 'r') as f:
-                    return json.loads(f.read())
-            return func
         if name.startswith("get_") or name in C.ACTION_TYPE_METHODS:
-            filename = os.path.join(self.path, "{}.json".format(name))
-            return load_json(filename)
+            return lambda **kwargs: self.load_json(name)
         elif name == "method_not_implemented":
             raise NotImplementedError
         else: